@@ -4,6 +4,7 @@
 
 import argparse
 import hy
+import os
 import sys
 
 # set the package version
@@ -12,6 +13,9 @@ import sys
 __version__ = "1.2.6"
 __version_info__ = __version__.split(".")
 
+# Pygments lexer names for the file types hylight accepts
+_LANG_BY_EXT = {".hy": "hylang", ".py": "python"}
+
 
 def __cli_grind_files():
     """Pretty-print hy files from the shell."""
@@ -86,8 +90,6 @@ def __cli_hylight_files():
     """Syntax highlight hy or python files from the shell."""
     from beautifhy import highlight
     from beautifhy.core import slurp
-    from pygments.formatters import TerminalFormatter
-    from pygments.lexers import get_lexer_by_name
 
     parser = argparse.ArgumentParser(
         description="Syntax highlight Hy or Python files.",
@@ -110,28 +112,27 @@ def __cli_hylight_files():
     if not args.files:
         code = sys.stdin.read()
         language = "hylang"
-        formatter = TerminalFormatter(style=highlight.style_name, bg=highlight.bg, stripall=True)
-        lexer = get_lexer_by_name(language)
+        formatter = highlight.formatter_for(highlight.style_name, highlight.bg)
+        lexer = highlight.lexer_for(language)
         print()
         print(highlight.highlight(code, lexer, formatter))
         print()
         return
 
     for fname in args.files:
-        if fname.endswith(".hy"):
-            language = "hylang"
-            code = slurp(fname)
-        elif fname.endswith(".py"):
-            language = "python"
-            code = slurp(fname)
-        elif fname == "-":
+        if fname == "-":
             language = "hylang"
             code = sys.stdin.read()
         else:
-            raise ValueError(f"Unrecognised file extension for {fname}.")
+            root, ext = os.path.splitext(fname)
+            # splitext treats dotfiles such as ".hy" as having no extension
+            language = _LANG_BY_EXT.get(ext or os.path.basename(root))
+            if language is None:
+                raise ValueError(f"Unrecognised file extension for {fname}.")
+            code = slurp(fname)
 
-        formatter = TerminalFormatter(style=highlight.style_name, bg=highlight.bg, stripall=True)
-        lexer = get_lexer_by_name(language)
+        formatter = highlight.formatter_for(highlight.style_name, highlight.bg)
+        lexer = highlight.lexer_for(language)
 
         print()
         print(highlight.highlight(code, lexer, formatter))
@@ -15,18 +15,24 @@ from hy.hy_inspect import HySafeReader
 class Comment(Keyword):
     """Represents a comment up to newline."""
 
+    __slots__ = ("name", "_hash", "_str")
+
     def __init__(self, value):
         self.name = str(value)
+        self._hash = hash(self.name)
+        self._str = None
 
     def __repr__(self):
         return f"hyjinx.reader.{self.__class__.__name__}({self.name!r})"
 
     def __str__(self):
         "Comments are terminated by a newline."
-        return ";%s\n" % self.name
+        if self._str is None:
+            self._str = f";{self.name}\n"
+        return self._str
 
     def __hash__(self):
-        return hash(self.name)
+        return self._hash
 
     def __eq__(self, other):
         return False
@@ -43,14 +49,44 @@ class Comment(Keyword):
 hy_repr_register(Comment, str)
 
 
+def _comment_closing(c):
+    return c == "\n"
+
+
 class HyReaderWithComments(HySafeReader):
     """A HyReader subclass that tokenizes comments."""
 
     @reader_for(";")
     def line_comment(self, _):
-
-        def comment_closing(c):
-            return c == "\n"
-
-        s = self.read_chars_until(comment_closing, "r;", is_fstring=False)
+        if self._peek_chars or self._saved_chars:
+            # Characters are buffered or being recorded, so stay on the
+            # char-by-char path that does that bookkeeping.
+            s = self.read_chars_until(_comment_closing, "r;", is_fstring=False)
+        else:
+            s = self._read_line()
         return Comment(s)
+
+    def _read_line(self):
+        """Consume up to and including the next newline in one call,
+        keeping the position bookkeeping that `getc` would do."""
+        s = self._stream.readline()
+        # A stream opened with newline="" also ends lines at a lone "\r",
+        # which `getc` does not treat as a line break, so read on to "\n".
+        while s and not s.endswith("\n"):
+            more = self._stream.readline()
+            if not more:
+                break
+            s += more
+        line, col = self._pos
+        body = s[:-1] if s.endswith("\n") else s
+        stripped = body.rstrip(" \t\n\r\f\v")
+        if stripped:
+            self._eof_tracker = (line, col + len(stripped))
+        if s.endswith("\n"):
+            self._pos = (line + 1, 0)
+        else:
+            self._pos = (line, col + len(s))
+            raise PrematureEndOfInput.from_reader(
+                "Premature end of input while streaming chars", self
+            )
+        return body.replace("\x0d\x0a", "\x0a").replace("\x0d", "\x0a")